@@ -446,7 +446,7 @@ def _extract_internal_request_schemas_from_router(
     router: fastapi.routing.APIRouter,
 ) -> dict[type[BaseModel], type[BaseModel]]:
     """Please note that this functon replaces internal bodies with original bodies in the router"""
-    schema_to_internal_request_body_representation = {}
+    schema_to_internal_request_body_representation: dict[type[BaseModel], type[BaseModel]] = {}
 
     def _extract_internal_request_schemas_from_annotations(annotations: dict[str, Any]):
         for key, annotation in annotations.items():
@@ -1,48 +1,116 @@
 import functools
 import inspect
+import sys
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from typing import Any, ClassVar, ParamSpec, cast, overload
+from dataclasses import dataclass
+from types import FunctionType
+from typing import Any, ClassVar, ParamSpec, overload
 
 from fastapi import Request, Response
-from starlette.datastructures import MutableHeaders
+from starlette.datastructures import Headers, MutableHeaders
 
 from cadwyn._utils import same_definition_as_in
 from cadwyn.structure.endpoints import _validate_that_strings_are_valid_http_methods
 
 _P = ParamSpec("_P")
+_VARIADIC_CODE_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
+class _CopyOnWriteHeaders(MutableHeaders):
+    """Mutable headers that share the underlying list with the original headers until they are first modified"""
+
+    def __init__(self, headers: Headers):
+        super().__init__(raw=headers._list)
+        self._is_copied = False
+
+    def _copy_before_write(self):
+        if not self._is_copied:
+            self._list = self._list.copy()
+            self._is_copied = True
+
+    def __setitem__(self, key: str, value: str) -> None:
+        self._copy_before_write()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._copy_before_write()
+        super().__delitem__(key)
+
+    @property
+    def raw(self) -> list[tuple[bytes, bytes]]:
+        # The raw list is exposed for modification so we have to assume that it will be modified
+        self._copy_before_write()
+        return self._list
+
+    def setdefault(self, key: str, value: str) -> str:
+        self._copy_before_write()
+        return super().setdefault(key, value)
+
+    def append(self, key: str, value: str) -> None:
+        self._copy_before_write()
+        super().append(key, value)
 
 
 # TODO (https://github.com/zmievsa/cadwyn/issues/49): Add form handling
 class RequestInfo:
-    __slots__ = ("body", "headers", "_cookies", "_query_params", "_request")
+    __slots__ = ("body", "_headers", "_cookies", "_query_params", "_request")
 
     def __init__(self, request: Request, body: Any):
         super().__init__()
         self.body = body
-        self.headers = request.headers.mutablecopy()
-        self._cookies = request.cookies
-        self._query_params = request.query_params._dict
+        # Headers, cookies, and query params are only parsed if a migration actually accesses them
+        self._headers: MutableHeaders | None = None
+        self._cookies: dict[str, str] | None = None
+        self._query_params: dict[str, str] | None = None
         self._request = request
 
+    @property
+    def headers(self) -> MutableHeaders:
+        if self._headers is None:
+            self._headers = _CopyOnWriteHeaders(self._request.headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: MutableHeaders):
+        self._headers = value
+
+    def _were_headers_changed(self) -> bool:
+        if self._headers is None:
+            return False
+        if isinstance(self._headers, _CopyOnWriteHeaders):
+            return self._headers._is_copied
+        # The headers were reassigned by a migration
+        return True
+
     @property
     def cookies(self) -> dict[str, str]:
+        if self._cookies is None:
+            self._cookies = self._request.cookies
         return self._cookies
 
     @property
     def query_params(self) -> dict[str, str]:
+        if self._query_params is None:
+            self._query_params = self._request.query_params._dict
         return self._query_params
 
 
 # TODO (https://github.com/zmievsa/cadwyn/issues/111): handle _response.media_type and _response.background
 class ResponseInfo:
-    __slots__ = ("body", "_response")
+    __slots__ = ("body", "_headers", "_response")
 
     def __init__(self, response: Response, body: Any):
         super().__init__()
         self.body = body
+        # Response.headers is a lazily created MutableHeaders that wraps the response's own list of headers
+        # so we can safely keep a reference to it instead of going through Response.headers on every access
+        self._headers = response.headers
         self._response = response
 
+    @property
+    def headers(self) -> MutableHeaders:
+        return self._headers
+
     @property
     def status_code(self) -> int:
         return self._response.status_code
@@ -51,10 +119,6 @@ class ResponseInfo:
     def status_code(self, value: int):
         self._response.status_code = value
 
-    @property
-    def headers(self) -> MutableHeaders:
-        return self._response.headers
-
     @same_definition_as_in(Response.set_cookie)
     def set_cookie(self, *args: Any, **kwargs: Any):
         return self._response.set_cookie(*args, **kwargs)
@@ -67,25 +131,39 @@ class ResponseInfo:
 @dataclass
 class _AlterDataInstruction:
     transformer: Callable[[Any], None]
-    owner: type = field(init=False)
     _payload_arg_name: ClassVar[str]
+    _expected_parameter_names: ClassVar[tuple[str, ...]]
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._expected_parameter_names = (cls._payload_arg_name,)
 
     def __post_init__(self):
-        signature = inspect.signature(self.transformer)
-        if list(signature.parameters) != [self._payload_arg_name]:
+        if _get_transformer_parameter_names(self.transformer) != self._expected_parameter_names:
             raise ValueError(
                 f"Method '{self.transformer.__name__}' must have only 1 parameter: {self._payload_arg_name}",
             )
 
         functools.update_wrapper(self, self.transformer)
 
+    # owner is deliberately not a dataclass field: it only exists once the instruction is bound to a version change
     def __set_name__(self, owner: type, name: str):
-        self.owner = owner
+        self.owner: type = owner
 
     def __call__(self, __request_or_response: RequestInfo | ResponseInfo, /) -> None:
         return self.transformer(__request_or_response)
 
 
+def _get_transformer_parameter_names(transformer: Callable[..., Any]) -> tuple[str, ...]:
+    # Wrapped functions, arbitrary callables, and functions with keyword-only or variadic parameters
+    # are rare enough to be handed to the full signature machinery to find their real parameters
+    if isinstance(transformer, FunctionType) and not hasattr(transformer, "__wrapped__"):
+        code = transformer.__code__
+        if not code.co_kwonlyargcount and not code.co_flags & _VARIADIC_CODE_FLAGS:
+            return code.co_varnames[: code.co_argcount]
+    return tuple(inspect.signature(transformer).parameters)
+
+
 ###########
 ## Requests
 ###########
@@ -104,7 +182,7 @@ class _AlterRequestBySchemaInstruction(_BaseAlterRequestInstruction):
 @dataclass
 class _AlterRequestByPathInstruction(_BaseAlterRequestInstruction):
     path: str
-    methods: set[str]
+    methods: frozenset[str]
     repr_name = "Request by path converter"
 
 
@@ -124,26 +202,25 @@ def convert_request_to_next_version_for(
     /,
     *additional_schemas: type,
 ) -> "type[staticmethod[_P, None]]":
-    _validate_decorator_args(schema_or_path, methods_or_second_schema, additional_schemas)
-
-    def decorator(transformer: Callable[[RequestInfo], None]) -> Any:
-        if isinstance(schema_or_path, str):
-            return _AlterRequestByPathInstruction(
-                path=schema_or_path,
-                methods=set(cast(list, methods_or_second_schema)),
-                transformer=transformer,
-            )
-        else:
-            if methods_or_second_schema is None:
-                schemas = (schema_or_path,)
-            else:
-                schemas = (schema_or_path, methods_or_second_schema, *additional_schemas)
-            return _AlterRequestBySchemaInstruction(
-                schemas=schemas,
-                transformer=transformer,
-            )
+    if isinstance(schema_or_path, str):
+        methods = _get_validated_methods(methods_or_second_schema, additional_schemas)
+        return _request_by_path_decorator(schema_or_path, methods)
+    schemas = _get_validated_schemas(schema_or_path, methods_or_second_schema, additional_schemas)
+    return _request_by_schema_decorator(schemas)
+
+
+def _request_by_path_decorator(path: str, methods: frozenset[str]) -> Any:
+    def decorator(transformer: Callable[[RequestInfo], None]) -> _AlterRequestByPathInstruction:
+        return _AlterRequestByPathInstruction(path=path, methods=methods, transformer=transformer)
 
-    return decorator  # pyright: ignore[reportReturnType]
+    return decorator
+
+
+def _request_by_schema_decorator(schemas: tuple[type, ...]) -> Any:
+    def decorator(transformer: Callable[[RequestInfo], None]) -> _AlterRequestBySchemaInstruction:
+        return _AlterRequestBySchemaInstruction(schemas=schemas, transformer=transformer)
+
+    return decorator
 
 
 ############
@@ -165,7 +242,7 @@ class _AlterResponseBySchemaInstruction(_BaseAlterResponseInstruction):
 @dataclass
 class _AlterResponseByPathInstruction(_BaseAlterResponseInstruction):
     path: str
-    methods: set[str]
+    methods: frozenset[str]
     repr_name = "Response by path converter"
 
 
@@ -195,40 +272,53 @@ def convert_response_to_previous_version_for(
     *additional_schemas: type,
     migrate_http_errors: bool = False,
 ) -> "type[staticmethod[_P, None]]":
-    _validate_decorator_args(schema_or_path, methods_or_second_schema, additional_schemas)
-
-    def decorator(transformer: Callable[[ResponseInfo], None]) -> Any:
-        if isinstance(schema_or_path, str):
-            # The validation above checks that methods is not None
-            return _AlterResponseByPathInstruction(
-                path=schema_or_path,
-                methods=set(cast(list, methods_or_second_schema)),
-                transformer=transformer,
-                migrate_http_errors=migrate_http_errors,
-            )
-        else:
-            if methods_or_second_schema is None:
-                schemas = (schema_or_path,)
-            else:
-                schemas = (schema_or_path, methods_or_second_schema, *additional_schemas)
-            return _AlterResponseBySchemaInstruction(
-                schemas=schemas,
-                transformer=transformer,
-                migrate_http_errors=migrate_http_errors,
-            )
-
-    return decorator  # pyright: ignore[reportReturnType]
-
-
-def _validate_decorator_args(
-    schema_or_path: type | str, methods_or_second_schema: list[str] | type | None, additional_schemas: tuple[type, ...]
-) -> None:
     if isinstance(schema_or_path, str):
-        if not isinstance(methods_or_second_schema, list):
-            raise TypeError("If path was provided as a first argument, methods must be provided as a second argument")
-        _validate_that_strings_are_valid_http_methods(methods_or_second_schema)
-        if additional_schemas:
-            raise TypeError("If path was provided as a first argument, then additional schemas cannot be added")
-
-    elif methods_or_second_schema is not None and not isinstance(methods_or_second_schema, type):
+        methods = _get_validated_methods(methods_or_second_schema, additional_schemas)
+        return _response_by_path_decorator(schema_or_path, methods, migrate_http_errors)
+    schemas = _get_validated_schemas(schema_or_path, methods_or_second_schema, additional_schemas)
+    return _response_by_schema_decorator(schemas, migrate_http_errors)
+
+
+def _response_by_path_decorator(path: str, methods: frozenset[str], migrate_http_errors: bool) -> Any:
+    def decorator(transformer: Callable[[ResponseInfo], None]) -> _AlterResponseByPathInstruction:
+        return _AlterResponseByPathInstruction(
+            path=path,
+            methods=methods,
+            transformer=transformer,
+            migrate_http_errors=migrate_http_errors,
+        )
+
+    return decorator
+
+
+def _response_by_schema_decorator(schemas: tuple[type, ...], migrate_http_errors: bool) -> Any:
+    def decorator(transformer: Callable[[ResponseInfo], None]) -> _AlterResponseBySchemaInstruction:
+        return _AlterResponseBySchemaInstruction(
+            schemas=schemas,
+            transformer=transformer,
+            migrate_http_errors=migrate_http_errors,
+        )
+
+    return decorator
+
+
+# The path/schema dispatch happens once in the decorator factories so these only validate a single call shape
+def _get_validated_methods(
+    methods_or_second_schema: list[str] | type | None, additional_schemas: tuple[type, ...]
+) -> frozenset[str]:
+    if not isinstance(methods_or_second_schema, list):
+        raise TypeError("If path was provided as a first argument, methods must be provided as a second argument")
+    _validate_that_strings_are_valid_http_methods(methods_or_second_schema)
+    if additional_schemas:
+        raise TypeError("If path was provided as a first argument, then additional schemas cannot be added")
+    return frozenset(map(sys.intern, methods_or_second_schema))
+
+
+def _get_validated_schemas(
+    first_schema: type, methods_or_second_schema: list[str] | type | None, additional_schemas: tuple[type, ...]
+) -> tuple[type, ...]:
+    if methods_or_second_schema is None:
+        return (first_schema,)
+    if not isinstance(methods_or_second_schema, type):
         raise TypeError("If schema was provided as a first argument, all other arguments must also be schemas")
+    return (first_schema, methods_or_second_schema, *additional_schemas)
@@ -1,3 +1,4 @@
+import sys
 from collections.abc import Callable, Collection, Sequence
 from dataclasses import dataclass
 from enum import Enum
@@ -120,29 +121,30 @@ class EndpointInstructionFactory:
         openapi_extra: dict[str, Any] = Sentinel,
         generate_unique_id_function: Callable[[APIRoute], str] = Sentinel,
     ):
+        # Positional arguments save us from 18 keyword bindings on every call. Keep them in the order of the fields.
         return EndpointHadInstruction(
-            endpoint_path=self.endpoint_path,
-            endpoint_methods=self.endpoint_methods,
-            endpoint_func_name=self.endpoint_func_name,
-            attributes=EndpointAttributesPayload(
-                path=path,
-                response_model=response_model,
-                status_code=status_code,
-                tags=tags,
-                dependencies=dependencies,
-                summary=summary,
-                description=description,
-                response_description=response_description,
-                responses=responses,
-                deprecated=deprecated,
-                methods=methods,
-                operation_id=operation_id,
-                include_in_schema=include_in_schema,
-                response_class=response_class,
-                name=name,
-                callbacks=callbacks,
-                openapi_extra=openapi_extra,
-                generate_unique_id_function=generate_unique_id_function,
+            self.endpoint_path,
+            self.endpoint_methods,
+            self.endpoint_func_name,
+            EndpointAttributesPayload(
+                path,
+                response_model,
+                status_code,
+                tags,
+                dependencies,
+                summary,
+                description,
+                response_description,
+                responses,
+                deprecated,
+                methods,
+                operation_id,
+                include_in_schema,
+                response_class,
+                name,
+                callbacks,
+                openapi_extra,
+                generate_unique_id_function,
             ),
         )
 
@@ -150,7 +152,7 @@ class EndpointInstructionFactory:
 def endpoint(path: str, methods: list[str], /, *, func_name: str | None = None) -> EndpointInstructionFactory:
     _validate_that_strings_are_valid_http_methods(methods)
 
-    return EndpointInstructionFactory(path, set(methods), func_name)
+    return EndpointInstructionFactory(path, set(map(sys.intern, methods)), func_name)
 
 
 def _validate_that_strings_are_valid_http_methods(methods: Collection[str]):
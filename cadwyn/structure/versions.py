@@ -80,6 +80,13 @@ class VersionChange:
     alter_request_by_path_instructions: ClassVar[dict[str, list[_AlterRequestByPathInstruction]]] = Sentinel
     alter_response_by_schema_instructions: ClassVar[dict[type, list[_AlterResponseBySchemaInstruction]]] = Sentinel
     alter_response_by_path_instructions: ClassVar[dict[str, list[_AlterResponseByPathInstruction]]] = Sentinel
+    # The same path instructions but indexed by each of their methods to match requests with a single lookup
+    _alter_request_by_path_and_method_instructions: ClassVar[
+        dict[tuple[str, str], list[_AlterRequestByPathInstruction]]
+    ] = Sentinel
+    _alter_response_by_path_and_method_instructions: ClassVar[
+        dict[tuple[str, str], list[_AlterResponseByPathInstruction]]
+    ] = Sentinel
     _bound_version_bundle: "VersionBundle | None"
 
     def __init_subclass__(cls, _abstract: bool = False) -> None:
@@ -101,11 +108,15 @@ class VersionChange:
                     cls.alter_request_by_schema_instructions[schema].append(instruction)
             elif isinstance(instruction, _AlterRequestByPathInstruction):
                 cls.alter_request_by_path_instructions[instruction.path].append(instruction)
+                for method in instruction.methods:
+                    cls._alter_request_by_path_and_method_instructions[instruction.path, method].append(instruction)
             elif isinstance(instruction, _AlterResponseBySchemaInstruction):
                 for schema in instruction.schemas:
                     cls.alter_response_by_schema_instructions[schema].append(instruction)
             elif isinstance(instruction, _AlterResponseByPathInstruction):
                 cls.alter_response_by_path_instructions[instruction.path].append(instruction)
+                for method in instruction.methods:
+                    cls._alter_response_by_path_and_method_instructions[instruction.path, method].append(instruction)
 
     @classmethod
     def _extract_list_instructions_into_correct_containers(cls):
@@ -117,6 +128,8 @@ class VersionChange:
         cls.alter_request_by_path_instructions = defaultdict(list)
         cls.alter_response_by_schema_instructions = defaultdict(list)
         cls.alter_response_by_path_instructions = defaultdict(list)
+        cls._alter_request_by_path_and_method_instructions = defaultdict(list)
+        cls._alter_response_by_path_and_method_instructions = defaultdict(list)
         for alter_instruction in cls.instructions_to_migrate_to_previous_version:
             if isinstance(alter_instruction, SchemaHadInstruction | AlterSchemaSubInstruction):
                 cls.alter_schema_instructions.append(alter_instruction)
@@ -456,12 +469,14 @@ class VersionBundle:
                 if body_type is not None and body_type in version_change.alter_request_by_schema_instructions:
                     for instruction in version_change.alter_request_by_schema_instructions[body_type]:
                         instruction(request_info)
-                if path in version_change.alter_request_by_path_instructions:
-                    for instruction in version_change.alter_request_by_path_instructions[path]:
-                        if method in instruction.methods:  # pragma: no branch # safe branch to skip
-                            instruction(request_info)
-        request.scope["headers"] = tuple((key.encode(), value.encode()) for key, value in request_info.headers.items())
-        del request._headers
+                if (path, method) in version_change._alter_request_by_path_and_method_instructions:
+                    for instruction in version_change._alter_request_by_path_and_method_instructions[path, method]:
+                        instruction(request_info)
+        if request_info._were_headers_changed():
+            request.scope["headers"] = tuple(
+                (key.encode(), value.encode()) for key, value in request_info.headers.items()
+            )
+            del request._headers
         # Remember this: if len(body_params) == 1, then route.body_schema == route.dependant.body_params[0]
 
         dependencies, errors, _, _, _ = await solve_dependencies(
@@ -508,10 +523,10 @@ class VersionBundle:
                         version_change.alter_response_by_schema_instructions[head_response_model]
                     )
 
-                if path in version_change.alter_response_by_path_instructions:
-                    for instruction in version_change.alter_response_by_path_instructions[path]:
-                        if method in instruction.methods:  # pragma: no branch # Safe branch to skip
-                            migrations_to_apply.append(instruction)
+                if (path, method) in version_change._alter_response_by_path_and_method_instructions:
+                    migrations_to_apply.extend(
+                        version_change._alter_response_by_path_and_method_instructions[path, method]
+                    )
 
                 for migration in migrations_to_apply:
                     if response_info.status_code < 300 or migration.migrate_http_errors:
@@ -15,6 +15,7 @@ from fastapi import APIRouter, Body, Cookie, File, Header, HTTPException, Query,
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
+from starlette.datastructures import MutableHeaders
 from starlette.responses import StreamingResponse
 
 from cadwyn import VersionedAPIRouter, generate_code_for_versioned_packages
@@ -305,6 +306,34 @@ class TestRequestMigrations:
             "query_params": {"request2": "request2"},
         }
 
+    # Plain mappings were accepted before RequestInfo.headers became a property so they must keep working
+    @pytest.mark.parametrize("headers_type", [MutableHeaders, dict])
+    def test__request_headers_migration__with_headers_reassigned__endpoint_should_receive_new_headers(
+        self,
+        create_versioned_clients: CreateVersionedClients,
+        test_path: Literal["/test"],
+        router: VersionedAPIRouter,
+        head_module: ModuleType,
+        headers_type: Callable[[dict[str, str]], Any],
+    ):
+        @router.get(test_path)
+        async def get(request: Request):
+            return dict(request.headers)
+
+        @convert_request_to_next_version_for(test_path, ["GET"])
+        def migrator(request: RequestInfo):
+            request.headers = headers_type({"new_header": "new val", "x-api-version": request.headers["x-api-version"]})
+
+        clients = create_versioned_clients(version_change(migrator=migrator))
+
+        assert clients[date(2000, 1, 1)].get(test_path, headers={"old_header": "old val"}).json() == {
+            "new_header": "new val",
+            "x-api-version": "2000-01-01",
+        }
+        assert clients[date(2001, 1, 1)].get(test_path, headers={"old_header": "old val"}).json() == IsPartialDict(
+            {"old_header": "old val", "x-api-version": "2001-01-01"}
+        )
+
     def test__depends_gets_broken_after_migration__should_raise_500(
         self,
         create_versioned_clients: CreateVersionedClients,
@@ -1079,6 +1108,48 @@ def test__request_and_response_migrations__for_paths_with_variables__can_match(
     assert clients[date(2001, 1, 1)].post("/test/83").json() == [83, "wow"]
 
 
+def test__request_and_response_migrations__for_same_path_with_different_methods__should_only_apply_to_own_method(
+    create_versioned_clients: CreateVersionedClients,
+    head_module,
+    router: VersionedAPIRouter,
+):
+    @router.get("/test")
+    async def get_endpoint(request: Request):
+        return [request.headers.get("x-migrations")]
+
+    @router.post("/test")
+    async def post_endpoint(request: Request):
+        return [request.headers.get("x-migrations")]
+
+    def mark_request(name: str):
+        def migration(request: RequestInfo):
+            request.headers["x-migrations"] = request.headers.get("x-migrations", "") + name
+
+        return migration
+
+    def mark_response(name: str):
+        def migration(response: ResponseInfo):
+            response.body.append(name)
+
+        return migration
+
+    clients = create_versioned_clients(
+        version_change(
+            post_request_1=convert_request_to_next_version_for("/test", ["POST"])(mark_request("post1 ")),
+            get_request=convert_request_to_next_version_for("/test", ["GET"])(mark_request("get ")),
+            post_request_2=convert_request_to_next_version_for("/test", ["POST"])(mark_request("post2 ")),
+            post_response_1=convert_response_to_previous_version_for("/test", ["POST"])(mark_response("post1")),
+            get_response=convert_response_to_previous_version_for("/test", ["GET"])(mark_response("get")),
+            post_response_2=convert_response_to_previous_version_for("/test", ["POST"])(mark_response("post2")),
+        )
+    )
+
+    assert clients[date(2000, 1, 1)].post("/test").json() == ["post1 post2 ", "post1", "post2"]
+    assert clients[date(2000, 1, 1)].get("/test").json() == ["get ", "get"]
+    assert clients[date(2001, 1, 1)].post("/test").json() == [None]
+    assert clients[date(2001, 1, 1)].get("/test").json() == [None]
+
+
 def test__request_and_response_migrations__for_endpoint_with_http_exception__can_migrate_to_200(
     create_versioned_clients: CreateVersionedClients,
     head_module,
@@ -1411,3 +1482,81 @@ def test__request_and_response_migrations__with_multiple_schemas_in_converters(
         resp_2001 = client_2001.post(f"/{endpoint}", json={"i": ["original_request"]})
         assert resp_2001.status_code == 200
         assert resp_2001.json() == {"i": ["original_request", endpoint]}
+
+
+def test__request_info_headers__should_not_copy_request_headers_until_modified():
+    request = Request({"type": "http", "headers": [(b"header_key", b"header val")]})
+    request_info = RequestInfo(request, body=None)
+
+    assert request_info.headers["header_key"] == "header val"
+    assert request_info.headers._list is request.headers._list
+
+    request_info.headers.append("header_key_2", "header val 2")
+
+    assert dict(request_info.headers) == {"header_key": "header val", "header_key_2": "header val 2"}
+    assert dict(request.headers) == {"header_key": "header val"}
+
+
+@pytest.mark.parametrize(
+    ("modify", "expected_headers"),
+    [
+        (lambda headers: headers.__setitem__("header_key", "header val 2"), {"header_key": "header val 2"}),
+        (lambda headers: headers.__delitem__("header_key"), {}),
+        (
+            lambda headers: headers.setdefault("header_key_2", "header val 2"),
+            {"header_key": "header val", "header_key_2": "header val 2"},
+        ),
+        (
+            lambda headers: headers.append("header_key_2", "header val 2"),
+            {"header_key": "header val", "header_key_2": "header val 2"},
+        ),
+        (
+            lambda headers: headers.raw.append((b"header_key_2", b"header val 2")),
+            {"header_key": "header val", "header_key_2": "header val 2"},
+        ),
+    ],
+)
+def test__request_info_headers__modification__should_copy_request_headers_before_writing(
+    modify: Callable[[Any], object],
+    expected_headers: dict[str, str],
+):
+    request = Request({"type": "http", "headers": [(b"header_key", b"header val")]})
+    request_info = RequestInfo(request, body=None)
+    original_header_list = request.headers._list
+
+    modify(request_info.headers)
+
+    assert request_info.headers._list is not original_header_list
+    assert dict(request_info.headers) == expected_headers
+    assert original_header_list == [(b"header_key", b"header val")]
+    assert dict(request.headers) == {"header_key": "header val"}
+
+    copied_header_list = request_info.headers._list
+    request_info.headers["header_key_3"] = "header val 3"
+
+    assert request_info.headers._list is copied_header_list
+    assert dict(request_info.headers) == expected_headers | {"header_key_3": "header val 3"}
+    assert dict(request.headers) == {"header_key": "header val"}
+
+
+def test__request_info_cookies_and_query_params__should_not_be_parsed_until_accessed():
+    request = Request({"type": "http", "headers": [(b"cookie", b"cookie_key=cookie val")], "query_string": b"a=b"})
+    request_info = RequestInfo(request, body=None)
+
+    assert request_info._cookies is None
+    assert request_info._query_params is None
+
+    assert request_info.cookies == {"cookie_key": "cookie val"}
+    assert request_info.query_params == {"a": "b"}
+    assert request_info.cookies is request_info.cookies
+    assert request_info.query_params is request_info.query_params
+
+
+def test__response_info_headers__should_be_the_response_headers_and_not_be_reassignable():
+    response = Response()
+    response_info = ResponseInfo(response, body=None)
+
+    assert response_info.headers is response.headers
+    with pytest.raises(AttributeError):
+        response_info.headers = MutableHeaders({"header_key": "header val"})  # pyright: ignore[reportAttributeAccessIssue]
+    assert dict(response.headers) == {"content-length": "0"}
@@ -1,3 +1,5 @@
+import functools
+import inspect
 import re
 from contextvars import ContextVar
 from datetime import date
@@ -18,6 +20,7 @@ from cadwyn.structure import (
     endpoint,
     schema,
 )
+from cadwyn.structure.endpoints import EndpointAttributesPayload, EndpointInstructionFactory
 from cadwyn.structure.schemas import FieldChanges, PossibleFieldAttributes
 
 
@@ -387,6 +390,65 @@ def test__convert_request_to_next_version_for__with_no_args__should_raise_error(
             raise NotImplementedError
 
 
+def test__convert_request_to_next_version_for__with_keyword_only_args__should_raise_error():
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "Method 'my_conversion_method' must have only 1 parameter: request",
+        ),
+    ):
+
+        @convert_request_to_next_version_for(SomeSchema)
+        def my_conversion_method(request: Any, *, payload: Any):  # pragma: no branch
+            raise NotImplementedError
+
+
+def test__convert_request_to_next_version_for__with_wrapped_transformer__should_use_signature_of_wrapped():
+    def transformer_decorator(transformer: Any):
+        # The wrapper's own parameter name is wrong so only the signature of the wrapped function is valid
+        @functools.wraps(transformer)
+        def wrapper(x: Any):  # pragma: no cover
+            return transformer(x)
+
+        return wrapper
+
+    def my_conversion_method(request: Any):  # pragma: no cover
+        raise NotImplementedError
+
+    wrapped_conversion_method = transformer_decorator(my_conversion_method)
+    instruction: Any = convert_request_to_next_version_for(SomeSchema)(wrapped_conversion_method)
+
+    assert instruction.transformer is wrapped_conversion_method
+    assert instruction.__name__ == "my_conversion_method"
+
+
+def test__convert_response_to_previous_version_for__instruction__should_copy_transformer_metadata():
+    def my_conversion_method(response: Any):  # pragma: no cover
+        """My docs"""
+
+    my_conversion_method.custom_attribute = 83  # pyright: ignore[reportFunctionMemberAccess]
+    instruction: Any = convert_response_to_previous_version_for(SomeSchema)(my_conversion_method)
+
+    assert instruction.__name__ == "my_conversion_method"
+    assert instruction.__qualname__ == my_conversion_method.__qualname__
+    assert instruction.__module__ == __name__
+    assert instruction.__doc__ == "My docs"
+    assert inspect.getdoc(instruction) == "My docs"
+    assert instruction.__annotations__ == {"response": Any}
+    assert instruction.__wrapped__ is my_conversion_method
+    assert instruction.custom_attribute == 83
+
+
+def test__convert_request_to_next_version_for__unbound_instruction__should_support_repr_and_eq():
+    def my_conversion_method(request: Any):  # pragma: no cover
+        raise NotImplementedError
+
+    instruction = convert_request_to_next_version_for(SomeSchema)(my_conversion_method)
+
+    assert repr(instruction).startswith("_AlterRequestBySchemaInstruction(transformer=")
+    assert instruction == convert_request_to_next_version_for(SomeSchema)(my_conversion_method)
+
+
 @pytest.mark.parametrize(
     ("attr_name", "attr_value"),
     [
@@ -417,6 +479,11 @@ def test__schema_field_had_arguments_are_in_sync_with_schema_field_didnt_have_ty
     assert set(parameter_names_in_field_had) == set(parameter_names_in_field_didnt_have)
 
 
+def test__endpoint_had_arguments_are_in_sync_with_endpoint_attributes_payload_fields():
+    parameter_names_in_endpoint_had = list(inspect.signature(EndpointInstructionFactory.had).parameters)[1:]
+    assert parameter_names_in_endpoint_had == list(EndpointAttributesPayload.__dataclass_fields__)
+
+
 def test__endpoint_instruction_factory_interface__with_wrong_http_methods__should_raise_error():
     with pytest.raises(
         LintingError,